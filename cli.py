@@ -13,5 +13,25 @@ def cli_interface() -> argparse.ArgumentParser:
         help="Specify one of the target profiles in HR config",
     )
     parser.add_argument("--input", type=Path, help="Path to JSON profiles")
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fully validate profiles (use for untrusted input)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't use cached target specifications",
+    )
+    parser.add_argument(
+        "--rebuild-cache",
+        action="store_true",
+        help="Rebuild cached target specification",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of processes to check profiles with (defaults to number of CPUs)",
+    )
 
     return parser
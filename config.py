@@ -1,2 +1,8 @@
 TARGET_POSITIONS_CONFIG_FILE = 'data/target_position_config.json'
 TEST_PROFILES_FILE = 'data/test_profiles.json'
+# profiles files larger than this are parsed iteratively
+PROFILES_STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
+SPECIFICATIONS_CACHE_DIR = '~/.cache/pitchme'
+# profiles are checked in chunks, in parallel if there are enough of them
+EVALUATION_CHUNK_SIZE = 512
+PARALLEL_EVALUATION_MIN_PROFILES = 4096
@@ -1,14 +1,219 @@
+import contextlib
+import io
 import json
+import multiprocessing
+import os
 import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
 
-import pydantic
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+else:
+    try:
+        # prefer C backend over pure python one
+        ijson = ijson.get_backend('yajl2_c')
+    except ImportError:
+        pass
 
 import config
 from cli import cli_interface
-from match_service.profile_schema import Profile
-from match_service.specifications import chain_specifications_for_position
+from match_service import cache
+from match_service.evaluation_schema import EvalProfile
+from match_service.profile_schema import (
+    Profile,
+    construct_profile,
+    sanitize_experiences,
+)
+from match_service.specifications import (
+    BaseSpecification,
+    chain_specifications_for_position,
+)
+
+
+def load_json(path: Path):
+    """
+    Decodes a JSON file with orjson if it is installed, falls back to stdlib json otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+
+    with open(path, 'rb') as json_file:
+        return json.load(json_file)
+
+
+def iter_raw_profiles(path: Path) -> Iterator[dict]:
+    """
+    Yields profiles from JSON file one by one.
+    Files larger than config.PROFILES_STREAMING_THRESHOLD_BYTES are parsed iteratively
+    (if ijson is installed), so the whole array is never held in memory.
+    """
+    if (
+        ijson is not None
+        and path.stat().st_size > config.PROFILES_STREAMING_THRESHOLD_BYTES
+    ):
+        with open(path, 'rb') as profiles_file:
+            yield from ijson.items(profiles_file, 'item', use_float=True)
+    else:
+        yield from load_json(path)
+
+
+def build_target_specification(
+    target_positions_path: Path, target_position_name: str
+) -> BaseSpecification:
+    """
+    Builds target specification for the position specified in target positions config.
+    """
+    target_positions = load_json(target_positions_path)
+    try:
+        target_position_criteria = target_positions[target_position_name]
+    except KeyError:
+        sys.exit(
+            'There are no target positions found with specified name. Add one first to perform a search'
+        )
+
+    return chain_specifications_for_position(target_position_criteria)
+
+
+def build_profile(profile: dict, strict: bool = False) -> EvalProfile:
+    """
+    Builds a candidate profile to be checked against specifications from parsed JSON.
+    Trusted input skips pydantic validation, strict mode validates every field.
+    """
+    if strict:
+        valid_profile = Profile(**profile)
+    else:
+        valid_profile = construct_profile(profile)
+
+    return EvalProfile.from_profile(sanitize_experiences(valid_profile))
+
+
+def iter_matched_candidates(
+    raw_profiles: Iterable[dict], target_specification: BaseSpecification, strict: bool
+) -> Iterator[Tuple[str, str]]:
+    """
+    Builds profiles one by one and checks them against target specification.
+    Yields first and last names of matched candidates as soon as they are found,
+    so matches are reported in order with messages about rejected candidates.
+    """
+    for profile in raw_profiles:
+        try:
+            valid_profile = build_profile(profile, strict=strict)
+        # pydantic.ValidationError is a subclass of ValueError,
+        # the rest are raised by trusted (non-validated) profiles with malformed data
+        except (AttributeError, KeyError, TypeError, ValueError):
+            print("Candidate provided invalid data - profile will not be considered.")
+            continue
+
+        if target_specification.is_satisfied_by(valid_profile):
+            yield valid_profile.first_name, valid_profile.last_name
+
+
+def evaluate_chunk(
+    raw_profiles: List[dict], target_specification: BaseSpecification, strict: bool
+) -> List[Tuple[str, str]]:
+    """
+    Builds profiles and checks them against target specification.
+    Returns first and last names of matched candidates.
+    """
+    return list(iter_matched_candidates(raw_profiles, target_specification, strict))
+
+
+# target specification and validation mode of a worker process, set once per process
+_worker_target_specification = None
+_worker_strict = False
+
+
+def _init_worker(target_specification: BaseSpecification, strict: bool) -> None:
+    global _worker_target_specification, _worker_strict
+    _worker_target_specification = target_specification
+    _worker_strict = strict
+
+
+def _evaluate_chunk_in_worker(
+    raw_profiles: List[dict],
+) -> Tuple[str, List[Tuple[str, str]]]:
+    # messages about rejected candidates are returned to the parent process to be written
+    # in chunk order, otherwise outputs of workers get interleaved mid-line
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        matched_candidates = evaluate_chunk(
+            raw_profiles, _worker_target_specification, _worker_strict
+        )
+
+    return output.getvalue(), matched_candidates
+
+
+def _iter_chunk_results(future: Future) -> Iterator[Tuple[str, str]]:
+    output, matched_candidates = future.result()
+    sys.stdout.write(output)
+    yield from matched_candidates
+
+
+def iter_chunks(items: Iterable[dict], chunk_size: int) -> Iterator[List[dict]]:
+    """
+    Splits items into lists of chunk_size items (the last one may be shorter).
+    Items are consumed lazily, so streamed profiles are never read into memory at once.
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def evaluate_profiles(
+    raw_profiles: Iterable[dict],
+    target_specification: BaseSpecification,
+    strict: bool = False,
+    workers: int = 1,
+) -> Iterator[Tuple[str, str]]:
+    """
+    Checks profiles against target specification and yields names of matched candidates.
+    Profiles are spread in chunks across worker processes unless there are too few of them
+    to pay off the pool start up. In that case matches of a chunk are yielded
+    after its messages about rejected candidates.
+    """
+    raw_profiles = iter(raw_profiles)
+    first_profiles = list(islice(raw_profiles, config.PARALLEL_EVALUATION_MIN_PROFILES))
+
+    if workers <= 1 or len(first_profiles) < config.PARALLEL_EVALUATION_MIN_PROFILES:
+        yield from iter_matched_candidates(
+            chain(first_profiles, raw_profiles), target_specification, strict
+        )
+        return
+
+    # workers are not forked from this process, since forking a process that may run threads
+    # (e.g. ones of imported libraries) can deadlock
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        start_method = 'forkserver'
+    else:
+        start_method = 'spawn'
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_init_worker,
+        initargs=(target_specification, strict),
+    ) as executor:
+        # limit the number of chunks in flight, so streamed profiles are not all read into memory
+        pending_chunks = deque()
+        for chunk in iter_chunks(
+            chain(first_profiles, raw_profiles), config.EVALUATION_CHUNK_SIZE
+        ):
+            pending_chunks.append(executor.submit(_evaluate_chunk_in_worker, chunk))
+            if len(pending_chunks) >= 2 * workers:
+                yield from _iter_chunk_results(pending_chunks.popleft())
+
+        while pending_chunks:
+            yield from _iter_chunk_results(pending_chunks.popleft())
 
 
 def main() -> None:
@@ -29,33 +234,32 @@ def main() -> None:
     if not target_positions_path.exists() or not target_positions_path.is_file():
         sys.exit(f'Error: file with available target positions is not found')
 
-    # Use iterative JSON parser for large JSON inputs (e.g. ijson library) in production environment
-    target_positions = json.load(open(target_positions_path))
-    try:
-        target_position_criteria = target_positions[target_position_name]
-    except KeyError:
-        sys.exit(
-            'There are no target positions found with specified name. Add one first to perform a search'
+    # build target specification to apply to each profile (or reuse the cached one)
+    if args.no_cache:
+        target_specification = build_target_specification(
+            target_positions_path, target_position_name
         )
+    else:
+        cache_path = cache.get_specification_cache_path(
+            config.SPECIFICATIONS_CACHE_DIR, target_position_name, target_positions_path
+        )
+        target_specification = None
+        if not args.rebuild_cache:
+            target_specification = cache.load_specification(cache_path)
+        if target_specification is None:
+            target_specification = build_target_specification(
+                target_positions_path, target_position_name
+            )
+            cache.store_specification(cache_path, target_specification)
 
-    # build target specification to apply to each profile
-    target_specification = chain_specifications_for_position(target_position_criteria)
-
-    # parse given profiles
-    available_profiles = []
-    # Use iterative JSON parser for large JSON inputs (e.g. ijson library) in production environment
-    for profile in json.load(open(profiles_file_path)):
-        try:
-            valid_profile = Profile(**profile)
-        except pydantic.ValidationError:
-            print("Candidate provided invalid data - profile will not be considered.")
-        else:
-            available_profiles.append(valid_profile)
-
-    # perform checks on each profile
-    for profile in available_profiles:
-        if target_specification.is_satisfied_by(profile):
-            print(f"{profile.first_name} {profile.last_name} - True")
+    # parse given profiles and perform checks on each profile in a single pass
+    for first_name, last_name in evaluate_profiles(
+        iter_raw_profiles(profiles_file_path),
+        target_specification,
+        strict=args.strict,
+        workers=args.workers or os.cpu_count() or 1,
+    ):
+        print(f"{first_name} {last_name} - True")
 
 
 if __name__ == '__main__':
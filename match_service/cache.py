@@ -0,0 +1,82 @@
+import functools
+import hashlib
+import pickle
+import re
+from pathlib import Path
+from typing import Union
+
+from match_service.specifications import BaseSpecification
+
+
+@functools.lru_cache(maxsize=None)
+def get_sources_digest() -> str:
+    """
+    Hashes sources of match_service package. Cached specifications are pickled instances
+    of its classes, so they become outdated once any module of the package is changed.
+    """
+    sources_digest = hashlib.sha1()
+    for source_path in sorted(Path(__file__).parent.glob('*.py')):
+        sources_digest.update(source_path.name.encode())
+        sources_digest.update(source_path.read_bytes())
+
+    return sources_digest.hexdigest()
+
+
+def get_specification_cache_path(
+    cache_dir: Union[str, Path], target_position_name: str, target_positions_path: Path
+) -> Path:
+    """
+    Builds path to the cached target specification.
+    Cache is keyed by target position name, modification time of target positions config
+    and sources of match_service package, so any change of the config or the package invalidates it.
+    """
+    position_name_slug = re.sub(r'[^\w-]+', '_', target_position_name)
+    position_name_digest = hashlib.sha1(target_position_name.encode()).hexdigest()[:8]
+    config_mtime = target_positions_path.stat().st_mtime_ns
+    version = hashlib.sha1(
+        f'{config_mtime}:{get_sources_digest()}'.encode()
+    ).hexdigest()[:12]
+
+    return (
+        Path(cache_dir).expanduser()
+        / f'{position_name_slug}-{position_name_digest}-{version}.pkl'
+    )
+
+
+def load_specification(cache_path: Path) -> Union[BaseSpecification, None]:
+    """
+    Loads target specification from cache. Returns None if there is no usable cache.
+    """
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            specification = pickle.load(cache_file)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        print('Cached target specification can not be loaded and will be rebuilt.')
+        return None
+
+    if not isinstance(specification, BaseSpecification):
+        return None
+
+    return specification
+
+
+def store_specification(cache_path: Path, specification: BaseSpecification) -> None:
+    """
+    Caches target specification. Caches built from outdated configs of the same position are removed.
+    Caching is skipped if the cache directory is not writable.
+    """
+    name_prefix = cache_path.name.rsplit('-', 1)[0]
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        for outdated_cache_path in cache_path.parent.glob(f'{name_prefix}-*.pkl'):
+            outdated_cache_path.unlink()
+
+        # write to a temporary file first, so concurrent runs never read a partially written cache
+        temporary_cache_path = cache_path.with_suffix('.tmp')
+        with open(temporary_cache_path, 'wb') as cache_file:
+            pickle.dump(specification, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        temporary_cache_path.replace(cache_path)
+    except OSError:
+        print('Target specification can not be cached.')
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Dict, FrozenSet, Tuple
+
+from match_service import constants, profile_schema, utils
+
+
+@dataclass(frozen=True, slots=True)
+class EvalLocation:
+    city: str
+    country: str
+
+
+@dataclass(frozen=True, slots=True)
+class EvalExperience:
+    company_name: str
+    job_title: str
+    # 'starts_at' and 'ends_at' dates as ordinals (see date.toordinal)
+    starts_ord: int
+    ends_ord: int
+    # lowercase skills used in comparisons
+    skills_lc: FrozenSet[str]
+
+
+@dataclass(frozen=True, slots=True)
+class EvalProfile:
+    """
+    Lightweight read-only twin of Profile which candidates are checked against specifications with.
+    Keeps only the data specifications need and precomputes lowercase tokens and sorted experiences.
+    """
+
+    first_name: str
+    last_name: str
+    location: EvalLocation
+    # experiences and their lowercase company names and job titles are sorted by 'ends_at'
+    experiences: Tuple[EvalExperience, ...]
+    skills_lc: FrozenSet[str]
+    company_names_lc: Tuple[str, ...]
+    job_titles_lc: Tuple[str, ...]
+    # experiences' dates as ordinals (see date.toordinal) sorted by 'starts_at'
+    starts_ordinals: Tuple[int, ...]
+    ends_ordinals: Tuple[int, ...]
+    _years_of_experience: Dict[bool, float] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_profile(cls, profile: profile_schema.Profile) -> EvalProfile:
+        """
+        Builds EvalProfile from a profile with sanitized experiences (see profile_schema.sanitize_experiences).
+        """
+        experiences = tuple(
+            sorted(
+                (
+                    EvalExperience(
+                        company_name=experience.company_name,
+                        job_title=experience.job_title,
+                        starts_ord=experience.starts_at.toordinal(),
+                        ends_ord=experience.ends_at.toordinal(),
+                        skills_lc=frozenset(
+                            [skill.lower() for skill in experience.skills]
+                        ),
+                    )
+                    for experience in profile.experiences
+                ),
+                key=attrgetter('ends_ord'),
+            )
+        )
+        experiences_by_starts_at = sorted(experiences, key=attrgetter('starts_ord'))
+
+        return cls(
+            first_name=profile.first_name,
+            last_name=profile.last_name,
+            location=EvalLocation(
+                city=profile.location.city, country=profile.location.country
+            ),
+            experiences=experiences,
+            skills_lc=frozenset([skill.lower() for skill in profile.skills]),
+            company_names_lc=tuple(
+                [experience.company_name.lower() for experience in experiences]
+            ),
+            job_titles_lc=tuple(
+                [experience.job_title.lower() for experience in experiences]
+            ),
+            starts_ordinals=tuple(
+                [experience.starts_ord for experience in experiences_by_starts_at]
+            ),
+            ends_ordinals=tuple(
+                [experience.ends_ord for experience in experiences_by_starts_at]
+            ),
+        )
+
+    def get_n_last_experiences(self, n: int) -> Tuple[EvalExperience, ...]:
+        """
+        Accepts candidate's sorted (by 'ends_at') experiences and lists a specified number (n) of last experiences.
+        Used further to determine whether a candidate:
+            - worked for a certain number of years
+            - worked for particular companies
+            - held particular positions
+            - used particular skills
+        during candidate's n last experiences.
+        If a candidate has fewer experiences (or exactly as many as) than we want to check,
+        all candidate's experiences are returned.
+        """
+        return self.experiences[-n:]
+
+    def count_years_of_experience(
+        self, count_overlapping_experiences: bool = False
+    ) -> float:
+        """
+        Accepts candidate's experiences and counts his/her years of experience.
+        Overlapping experiences can be counted as an option.
+        """
+        if count_overlapping_experiences in self._years_of_experience:
+            return self._years_of_experience[count_overlapping_experiences]
+
+        # a candidate has a few experiences, so plain python is faster than vectorized code here
+        intervals = [
+            [start, end] for start, end in zip(self.starts_ordinals, self.ends_ordinals)
+        ]
+        if not count_overlapping_experiences:
+            intervals = utils.merge_intervals(intervals)
+
+        # count days of experience based on time intervals
+        days_of_experience = sum([end - start for start, end in intervals])
+
+        # count years of experience based on average number of days in a year and floor rounding
+        years_of_experience = round(
+            days_of_experience / constants.NUMBER_OF_DAYS_IN_ONE_YEAR, 1
+        )
+        self._years_of_experience[count_overlapping_experiences] = years_of_experience
+        return years_of_experience
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Iterable, List, Literal, Union
+from operator import attrgetter
+from typing import Callable, ClassVar, Dict, Iterable, List, Literal, Tuple, Union
 
-from match_service import constants, profile_schema, utils
+from match_service import constants, evaluation_schema, utils
 
 
 class SelectionCriteria(Enum):
@@ -23,23 +24,37 @@ class BaseSpecification(ABC):
     https://en.wikipedia.org/wiki/Specification_pattern
     """
 
+    __slots__ = ()
+
+    # relative cost of a single check, cheaper specifications are checked first when chained
+    evaluation_cost: ClassVar[int] = 0
+
     @abstractmethod
-    def is_satisfied_by(self, candidate: profile_schema.Profile) -> bool:
+    def is_satisfied_by(self, candidate: evaluation_schema.EvalProfile) -> bool:
         ...
 
-    def and_(self, other: BaseSpecification) -> AndSpecification:
-        return AndSpecification(self, other)
+    def and_(self, other: BaseSpecification) -> AllSpecification:
+        return AllSpecification((self, other))
 
 
-@dataclass(frozen=True)
-class AndSpecification(BaseSpecification):
-    first: BaseSpecification
-    second: BaseSpecification
+@dataclass(frozen=True, slots=True)
+class AllSpecification(BaseSpecification):
+    """
+    Is satisfied if all the specifications are satisfied.
+    Specifications are checked in the given order and checks stop at the first unsatisfied one.
+    """
 
-    def is_satisfied_by(self, candidate: profile_schema.Profile) -> bool:
-        return self.first.is_satisfied_by(candidate) and self.second.is_satisfied_by(
-            candidate
-        )
+    specifications: Tuple[BaseSpecification, ...]
+
+    def is_satisfied_by(self, candidate: evaluation_schema.EvalProfile) -> bool:
+        for specification in self.specifications:
+            if not specification.is_satisfied_by(candidate):
+                return False
+
+        return True
+
+    def and_(self, other: BaseSpecification) -> AllSpecification:
+        return AllSpecification((*self.specifications, other))
 
 
 @dataclass
@@ -49,19 +64,18 @@ class EmployerNameSpecification(BaseSpecification):
     last n experiences was with one of the expected companies.
     """
 
+    evaluation_cost: ClassVar[int] = 2
+
     companies_expected: utils.LowerCaseFrozenSet[str]
     number_of_last_experiences_to_be_checked: int
 
-    def is_satisfied_by(self, candidate: profile_schema.Profile) -> bool:
-        experiences_to_be_checked = candidate.get_n_last_experiences(
-            self.number_of_last_experiences_to_be_checked
-        )
-        employer_names = utils.LowerCaseFrozenSet(
-            {experience.company_name for experience in experiences_to_be_checked}
-        )
-
-        employer_name_criteria_is_met = bool(
-            len(employer_names.intersection(self.companies_expected))
+    def is_satisfied_by(self, candidate: evaluation_schema.EvalProfile) -> bool:
+        # stops at the first matching employer
+        employer_name_criteria_is_met = any(
+            employer_name in self.companies_expected
+            for employer_name in candidate.company_names_lc[
+                -self.number_of_last_experiences_to_be_checked :
+            ]
         )
 
         if employer_name_criteria_is_met:
@@ -81,9 +95,14 @@ class LocationSpecification(BaseSpecification):
     Checks whether a candidate meets location criteria.
     """
 
+    evaluation_cost: ClassVar[int] = 0
+
     expected_locations: Iterable[str]
 
-    def is_satisfied_by(self, candidate: profile_schema.Profile) -> bool:
+    def __post_init__(self):
+        self.expected_locations = frozenset(self.expected_locations)
+
+    def is_satisfied_by(self, candidate: evaluation_schema.EvalProfile) -> bool:
         if (
             candidate.location.country in self.expected_locations
             or candidate.location.city in self.expected_locations
@@ -105,18 +124,24 @@ class TotalWorkExperienceSpecification(BaseSpecification):
     Overlapping experiences can be counted as an option.
     """
 
+    evaluation_cost: ClassVar[int] = 3
+
     years_of_experience_expected: float
     comparison_operand: Literal['>', '>=', '==', '<', '<=']
     count_overlapping_experiences: bool = False
+    _compare: Callable[[float, float], bool] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._compare = utils.comparison_functions[self.comparison_operand]
 
-    def is_satisfied_by(self, candidate: profile_schema.Profile) -> bool:
+    def is_satisfied_by(self, candidate: evaluation_schema.EvalProfile) -> bool:
         total_years_of_experience = candidate.count_years_of_experience(
             count_overlapping_experiences=self.count_overlapping_experiences
         )
 
-        if utils.comparison_functions[self.comparison_operand](
-            total_years_of_experience, self.years_of_experience_expected
-        ):
+        if self._compare(total_years_of_experience, self.years_of_experience_expected):
             return True
 
         print(
@@ -132,14 +157,18 @@ class SkillsSpecification(BaseSpecification):
     Checks whether candidate skills match the required number of expected skills
     """
 
+    evaluation_cost: ClassVar[int] = 1
+
     expected_skills: utils.LowerCaseFrozenSet[str]
     number_of_hits: Union[int, None] = None
+    _skills_check: Callable[..., bool] = field(init=False, repr=False, compare=False)
 
-    def is_satisfied_by(self, candidate: profile_schema.Profile) -> bool:
-        skills_to_be_checked = utils.LowerCaseFrozenSet(candidate.skills)
+    def __post_init__(self):
+        self._skills_check = utils.get_intersection_or_subset_check(self.number_of_hits)
 
-        skills_criteria_is_met = utils.has_intersection_or_is_subset(
-            skills_to_be_checked,
+    def is_satisfied_by(self, candidate: evaluation_schema.EvalProfile) -> bool:
+        skills_criteria_is_met = self._skills_check(
+            candidate.skills_lc,
             self.expected_skills,
             number_of_hits=self.number_of_hits,
         )
@@ -160,22 +189,27 @@ class SkillsAtWorkSpecification(BaseSpecification):
     match the required number of expected skills
     """
 
+    evaluation_cost: ClassVar[int] = 4
+
     expected_skills: utils.LowerCaseFrozenSet[str]
     number_of_last_experiences_to_be_checked: int
     number_of_hits: Union[int, None] = None
-
-    def is_satisfied_by(self, candidate: profile_schema.Profile) -> bool:
-        experiences_to_be_checked = candidate.get_n_last_experiences(
-            self.number_of_last_experiences_to_be_checked
+    _skills_check: Callable[..., bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._skills_check = utils.get_intersection_or_subset_check(self.number_of_hits)
+
+    def is_satisfied_by(self, candidate: evaluation_schema.EvalProfile) -> bool:
+        skills_to_be_checked = frozenset().union(
+            *[
+                experience.skills_lc
+                for experience in candidate.get_n_last_experiences(
+                    self.number_of_last_experiences_to_be_checked
+                )
+            ]
         )
 
-        skills_to_be_checked = set()
-        for experience in experiences_to_be_checked:
-            for skill in experience.skills:
-                skills_to_be_checked.add(skill)
-        skills_to_be_checked = utils.LowerCaseFrozenSet(skills_to_be_checked)
-
-        skills_criteria_is_met = utils.has_intersection_or_is_subset(
+        skills_criteria_is_met = self._skills_check(
             skills_to_be_checked,
             self.expected_skills,
             number_of_hits=self.number_of_hits,
@@ -198,19 +232,18 @@ class PositionSpecification(BaseSpecification):
     last n experiences matches one of the expected positions.
     """
 
+    evaluation_cost: ClassVar[int] = 2
+
     positions_expected: utils.LowerCaseFrozenSet[str]
     number_of_last_experiences_to_be_checked: int
 
-    def is_satisfied_by(self, candidate: profile_schema.Profile) -> bool:
-        experiences_to_be_checked = candidate.get_n_last_experiences(
-            self.number_of_last_experiences_to_be_checked
-        )
-        positions_held = utils.LowerCaseFrozenSet(
-            {experience.job_title for experience in experiences_to_be_checked}
-        )
-
-        occupied_position_criteria_is_met = bool(
-            len(positions_held.intersection(self.positions_expected))
+    def is_satisfied_by(self, candidate: evaluation_schema.EvalProfile) -> bool:
+        # stops at the first matching position
+        occupied_position_criteria_is_met = any(
+            position_held in self.positions_expected
+            for position_held in candidate.job_titles_lc[
+                -self.number_of_last_experiences_to_be_checked :
+            ]
         )
 
         if occupied_position_criteria_is_met:
@@ -231,30 +264,32 @@ class WorkExperienceLengthSpecification(BaseSpecification):
     at least one of those n last experiences.
     """
 
+    evaluation_cost: ClassVar[int] = 2
+
     years_of_experience_expected: int
     comparison_operand: Literal['>', '>=', '==', '<', '<=']
     number_of_last_experiences_to_be_checked: int = 1
+    _compare: Callable[[float, float], bool] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._compare = utils.comparison_functions[self.comparison_operand]
 
-    def is_satisfied_by(self, candidate: profile_schema.Profile) -> bool:
+    def is_satisfied_by(self, candidate: evaluation_schema.EvalProfile) -> bool:
         last_n_experiences = candidate.get_n_last_experiences(
             self.number_of_last_experiences_to_be_checked
         )
 
-        longest_experience = max(
-            last_n_experiences,
-            key=lambda experience: int(
-                (experience.ends_at - experience.starts_at).days
-            ),
-        )
-
-        longest_experience_in_days = int(
-            (longest_experience.ends_at - longest_experience.starts_at).days
+        longest_experience_in_days = max(
+            experience.ends_ord - experience.starts_ord
+            for experience in last_n_experiences
         )
         longest_experience_in_years = round(
             longest_experience_in_days / constants.NUMBER_OF_DAYS_IN_ONE_YEAR, 1
         )
 
-        if utils.comparison_functions[self.comparison_operand](
+        if self._compare(
             longest_experience_in_years, self.years_of_experience_expected
         ):
             return True
@@ -266,98 +301,123 @@ class WorkExperienceLengthSpecification(BaseSpecification):
         return False
 
 
-def specification_factory(
-    criteria_name: str, criteria_value: Union[str, dict, List[str]]
-) -> Union[BaseSpecification, None]:
+def _validate_last_n(check_last_n_experiences: Union[int, None]) -> Union[int, None]:
     """
-    Maps HR config values to specifications
-    and returns instances of BaseSpecification.
+    Checks whether the number of experiences to be checked (as per target
+    position requirements) (if such criteria is present) is greater than or equal to one.
     """
-    # check whether the number of experiences to be checked (as per target
-    # position requirements) (if such criteria is present) is greater than or equal to one
-    if 'check_last_n_experiences' in criteria_value:
-        check_last_n_experiences = criteria_value['check_last_n_experiences']
-
-        if check_last_n_experiences < 1:
-            raise ValueError(
-                f'Specified number (n) of last experiences should be >= 1, '
-                f'but {check_last_n_experiences} is given. Fix the target_position_config and retry'
-            )
-
-    # instantiate particular specification based on criteria name
-    if criteria_name == SelectionCriteria.EMPLOYER.value:
-        if criteria_value['name'] == 'FAANG':
-            companies_expected = constants.FAANG
-        else:
-            companies_expected = utils.LowerCaseFrozenSet({criteria_value['name']})
-
-        return EmployerNameSpecification(
-            companies_expected=companies_expected,
-            number_of_last_experiences_to_be_checked=criteria_value[
-                'check_last_n_experiences'
-            ],
+    if check_last_n_experiences is not None and check_last_n_experiences < 1:
+        raise ValueError(
+            f'Specified number (n) of last experiences should be >= 1, '
+            f'but {check_last_n_experiences} is given. Fix the target_position_config and retry'
         )
 
-    elif criteria_name == SelectionCriteria.LOCATION.value:
-        if not criteria_value['countries'] and not criteria_value['cities']:
-            raise ValueError(f'Specify either country or city within location criteria')
-
-        if criteria_value['countries']:
-            for index, country in enumerate(criteria_value['countries']):
-                countries = {*criteria_value['countries']}
-                if country.upper() == 'EU':
-                    countries = {
-                        *criteria_value['countries'][:index],
-                        *constants.EU_COUNTRIES,
-                        *criteria_value['countries'][index + 1 :],
-                    }
-                return LocationSpecification(countries)
-        else:
-            cities = {*criteria_value['cities']}
-            return LocationSpecification(cities)
-
-    elif criteria_name == SelectionCriteria.EXPERIENCE_TOTAL.value:
-        return TotalWorkExperienceSpecification(
-            years_of_experience_expected=criteria_value['years'],
-            comparison_operand=criteria_value['comparison_operand'],
-        )
+    return check_last_n_experiences
 
-    elif criteria_name == SelectionCriteria.SKILLS.value:
-        return SkillsSpecification(
-            expected_skills=utils.LowerCaseFrozenSet(criteria_value['name']),
-            number_of_hits=criteria_value.get('number_of_hits', None),
-        )
 
-    elif criteria_name == SelectionCriteria.SKILLS_AT_WORK.value:
-        return SkillsAtWorkSpecification(
-            expected_skills=utils.LowerCaseFrozenSet(criteria_value['name']),
-            number_of_hits=criteria_value.get('number_of_hits', None),
-            number_of_last_experiences_to_be_checked=criteria_value.get(
-                'check_last_n_experiences'
-            ),
+def _build_employer(criteria_value: dict) -> EmployerNameSpecification:
+    if criteria_value['name'] == 'FAANG':
+        companies_expected = utils.LowerCaseFrozenSet.from_already_lower(
+            constants.FAANG
         )
+    else:
+        companies_expected = utils.LowerCaseFrozenSet({criteria_value['name']})
+
+    return EmployerNameSpecification(
+        companies_expected=companies_expected,
+        number_of_last_experiences_to_be_checked=_validate_last_n(
+            criteria_value['check_last_n_experiences']
+        ),
+    )
+
+
+def _build_location(criteria_value: dict) -> LocationSpecification:
+    if not criteria_value['countries'] and not criteria_value['cities']:
+        raise ValueError(f'Specify either country or city within location criteria')
+
+    if criteria_value['countries']:
+        countries = set(criteria_value['countries'])
+        # 'EU' stands for all EU member states
+        eu_aliases = {country for country in countries if country.upper() == 'EU'}
+        if eu_aliases:
+            countries = (countries - eu_aliases) | constants.EU_COUNTRIES
+        return LocationSpecification(frozenset(countries))
+    else:
+        return LocationSpecification(frozenset(criteria_value['cities']))
 
-    elif criteria_name == SelectionCriteria.POSITION.value:
-        return PositionSpecification(
-            positions_expected=utils.LowerCaseFrozenSet(criteria_value['name']),
-            number_of_last_experiences_to_be_checked=criteria_value.get(
-                'check_last_n_experiences'
-            ),
-        )
 
-    elif criteria_name == SelectionCriteria.DURATION_OF_EMPLOYMENT.value:
-        return WorkExperienceLengthSpecification(
-            years_of_experience_expected=criteria_value['years'],
-            comparison_operand=criteria_value['comparison_operand'],
-            number_of_last_experiences_to_be_checked=criteria_value[
-                'check_last_n_experiences'
-            ],
-        )
-    else:
+def _build_experience_total(criteria_value: dict) -> TotalWorkExperienceSpecification:
+    return TotalWorkExperienceSpecification(
+        years_of_experience_expected=criteria_value['years'],
+        comparison_operand=criteria_value['comparison_operand'],
+    )
+
+
+def _build_skills(criteria_value: dict) -> SkillsSpecification:
+    return SkillsSpecification(
+        expected_skills=utils.LowerCaseFrozenSet(criteria_value['name']),
+        number_of_hits=criteria_value.get('number_of_hits', None),
+    )
+
+
+def _build_skills_at_work(criteria_value: dict) -> SkillsAtWorkSpecification:
+    return SkillsAtWorkSpecification(
+        expected_skills=utils.LowerCaseFrozenSet(criteria_value['name']),
+        number_of_hits=criteria_value.get('number_of_hits', None),
+        number_of_last_experiences_to_be_checked=_validate_last_n(
+            criteria_value.get('check_last_n_experiences')
+        ),
+    )
+
+
+def _build_position(criteria_value: dict) -> PositionSpecification:
+    return PositionSpecification(
+        positions_expected=utils.LowerCaseFrozenSet(criteria_value['name']),
+        number_of_last_experiences_to_be_checked=_validate_last_n(
+            criteria_value.get('check_last_n_experiences')
+        ),
+    )
+
+
+def _build_duration_of_employment(
+    criteria_value: dict,
+) -> WorkExperienceLengthSpecification:
+    return WorkExperienceLengthSpecification(
+        years_of_experience_expected=criteria_value['years'],
+        comparison_operand=criteria_value['comparison_operand'],
+        number_of_last_experiences_to_be_checked=_validate_last_n(
+            criteria_value['check_last_n_experiences']
+        ),
+    )
+
+
+_BUILDERS: Dict[str, Callable[[dict], BaseSpecification]] = {
+    SelectionCriteria.EMPLOYER.value: _build_employer,
+    SelectionCriteria.LOCATION.value: _build_location,
+    SelectionCriteria.EXPERIENCE_TOTAL.value: _build_experience_total,
+    SelectionCriteria.SKILLS.value: _build_skills,
+    SelectionCriteria.SKILLS_AT_WORK.value: _build_skills_at_work,
+    SelectionCriteria.POSITION.value: _build_position,
+    SelectionCriteria.DURATION_OF_EMPLOYMENT.value: _build_duration_of_employment,
+}
+
+
+def specification_factory(
+    criteria_name: str, criteria_value: Union[str, dict, List[str]]
+) -> Union[BaseSpecification, None]:
+    """
+    Maps HR config values to specifications
+    and returns instances of BaseSpecification.
+    """
+    builder = _BUILDERS.get(criteria_name)
+    if builder is None:
         print(
             f'Criteria name "{criteria_name}" specified in config '
             f'is not supported, therefore, will be ignored'
         )
+        return None
+
+    return builder(criteria_value)
 
 
 def chain_specifications_for_position(
@@ -365,18 +425,16 @@ def chain_specifications_for_position(
 ) -> BaseSpecification:
     """
     Chains specifications for a position according to the specified set of criteria.
+    Cheaper specifications are checked first.
     """
     specifications = []
     for criteria_name, criteria_value in target_profile_criteria.items():
         specification = specification_factory(criteria_name, criteria_value)
         if specification:
             specifications.append(specification)
-    try:
-        target_specification = specifications[0]
-    except IndexError:
+    if not specifications:
         raise ValueError('Please specify at least one valid target profile criteria')
 
-    for i in range(1, len(specifications)):
-        target_specification = target_specification.and_(specifications[i])
-
-    return target_specification
+    return AllSpecification(
+        tuple(sorted(specifications, key=attrgetter('evaluation_cost')))
+    )
@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import operator
 from datetime import date
-from operator import methodcaller
-from typing import List
+from typing import Callable, List, TypeVar
 
 comparison_functions = {
-    ">": lambda x, y: x > y,
-    ">=": lambda x, y: x >= y,
-    "<": lambda x, y: x < y,
-    "<=": lambda x, y: x <= y,
-    "==": lambda x, y: x == y,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
 }
 
 
-def merge_intervals(intervals: List[List[date]]) -> List[List[date]]:
+# intervals' bounds are either dates or date ordinals (see date.toordinal)
+IntervalBound = TypeVar('IntervalBound', date, int)
+
+
+def merge_intervals(
+    intervals: List[List[IntervalBound]],
+) -> List[List[IntervalBound]]:
     """
-    Merges time intervals to avoid counting overlapping experience.
+    Merges time intervals (sorted by start) to avoid counting overlapping experience.
     Used further to calculate years of non-overlapping experience of a candidate.
     """
+    if not intervals:
+        return []
+
     non_overlapping_intervals = [intervals[0]]
 
     for start, end in intervals[1:]:
@@ -37,21 +46,48 @@ class LowerCaseFrozenSet(frozenset):
     """
 
     def __new__(cls, data):
-        data = set(map(methodcaller('lower'), data))
+        return super(LowerCaseFrozenSet, cls).__new__(
+            cls, [item.lower() for item in data]
+        )
+
+    @classmethod
+    def from_already_lower(cls, data) -> LowerCaseFrozenSet:
+        """
+        Skips lowercasing for data known to be in lowercase already
+        """
         return super(LowerCaseFrozenSet, cls).__new__(cls, data)
 
 
-def has_intersection_or_is_subset(
+def has_number_of_intersections(
     set_to_evaluate: LowerCaseFrozenSet[str],
     required_set: LowerCaseFrozenSet[str],
     number_of_hits: int,
 ) -> bool:
     """
-    Depending on number_of_hits determines if set_to_evaluate
-    has intersection with or is subset of required_set
+    Determines if set_to_evaluate has exactly number_of_hits common elements with required_set
     """
-    if number_of_hits:
-        number_of_intersections = len(set_to_evaluate.intersection(required_set))
-        return number_of_intersections == number_of_hits
+    return len(set_to_evaluate.intersection(required_set)) == number_of_hits
 
+
+def is_subset(
+    set_to_evaluate: LowerCaseFrozenSet[str],
+    required_set: LowerCaseFrozenSet[str],
+    number_of_hits: None = None,
+) -> bool:
+    """
+    Determines if required_set is subset of set_to_evaluate
+    """
     return required_set.issubset(set_to_evaluate)
+
+
+def get_intersection_or_subset_check(
+    number_of_hits: int,
+) -> Callable[[LowerCaseFrozenSet[str], LowerCaseFrozenSet[str], int], bool]:
+    """
+    Depending on number_of_hits resolves if a set should have intersection with
+    or be subset of required set, so the check is chosen once instead of on every comparison
+    """
+    if number_of_hits:
+        return has_number_of_intersections
+
+    return is_subset
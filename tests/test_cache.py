@@ -0,0 +1,90 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from match_service import cache, specifications
+
+TARGET_SPECIFICATION = specifications.chain_specifications_for_position(
+    {
+        "location": {"countries": ["EU"], "cities": []},
+        "experience_total": {"comparison_operand": "<", "years": 5},
+        "skills": {"name": ["Figma", "Sketch", "UX-research"], "number_of_hits": 2},
+    }
+)
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        temporary_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_dir.cleanup)
+        self.cache_dir = Path(temporary_dir.name) / 'cache'
+        self.config_path = Path(temporary_dir.name) / 'target_positions.json'
+        self.config_path.write_text('{}')
+
+    def get_cache_path(self):
+        return cache.get_specification_cache_path(
+            self.cache_dir, 'Middle UX-designer', self.config_path
+        )
+
+    def test_get_specification_cache_path(self):
+        cache_path = self.get_cache_path()
+        self.assertEqual(cache_path.parent, self.cache_dir)
+        self.assertTrue(cache_path.name.startswith('Middle_UX-designer-'))
+        self.assertEqual(cache_path, self.get_cache_path())
+
+    def test_load_missing_specification(self):
+        self.assertIsNone(cache.load_specification(self.get_cache_path()))
+
+    def test_store_and_load_specification(self):
+        cache_path = self.get_cache_path()
+        cache.store_specification(cache_path, TARGET_SPECIFICATION)
+        self.assertEqual(cache.load_specification(cache_path), TARGET_SPECIFICATION)
+
+    def test_load_corrupted_specification(self):
+        cache_path = self.get_cache_path()
+        self.cache_dir.mkdir()
+        cache_path.write_bytes(b'not a pickle')
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(cache.load_specification(cache_path))
+
+    def test_config_change_invalidates_cache(self):
+        cache_path = self.get_cache_path()
+        cache.store_specification(cache_path, TARGET_SPECIFICATION)
+        config_stat = self.config_path.stat()
+        os.utime(
+            self.config_path,
+            ns=(config_stat.st_atime_ns, config_stat.st_mtime_ns + 1_000_000_000),
+        )
+
+        updated_cache_path = self.get_cache_path()
+        self.assertNotEqual(updated_cache_path, cache_path)
+        self.assertIsNone(cache.load_specification(updated_cache_path))
+
+        cache.store_specification(updated_cache_path, TARGET_SPECIFICATION)
+        self.assertEqual(list(self.cache_dir.iterdir()), [updated_cache_path])
+
+    def test_sources_change_invalidates_cache(self):
+        cache_path = self.get_cache_path()
+        cache.store_specification(cache_path, TARGET_SPECIFICATION)
+
+        with mock.patch.object(cache, 'get_sources_digest', return_value='changed'):
+            updated_cache_path = self.get_cache_path()
+        self.assertNotEqual(updated_cache_path, cache_path)
+        self.assertIsNone(cache.load_specification(updated_cache_path))
+
+    def test_store_specification_to_unwritable_dir(self):
+        # cache directory can not be created inside of a regular file
+        self.cache_dir.write_text('')
+        cache_path = self.get_cache_path()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            cache.store_specification(cache_path, TARGET_SPECIFICATION)
+        self.assertEqual(output.getvalue(), 'Target specification can not be cached.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import datetime
+import unittest
+
+from match_service import evaluation_schema, profile_schema
+
+TEST_PROFILE = evaluation_schema.EvalProfile.from_profile(
+    profile_schema.Profile(
+        **{
+            "first_name": "Alice",
+            "last_name": "Lee",
+            "skills": ["Java", "Python"],
+            "description": "I'm a full-stack developer.",
+            "location": {"city": "London", "country": "UK"},
+            "experiences": [
+                {
+                    "company_name": "Google",
+                    "job_title": "Software Engineer",
+                    "description": "Developed and maintained web applications.",
+                    "skills": ["Python", "SQL"],
+                    "starts_at": "2016-01-01",
+                    "ends_at": "2020-01-01",
+                    "location": {"city": "London", "country": "UK"},
+                },
+                {
+                    "company_name": "Apple",
+                    "job_title": "Senior Engineer",
+                    "description": "Developed and maintained web applications.",
+                    "skills": ["Python", "SQL"],
+                    "starts_at": "2019-01-01",
+                    "ends_at": "2021-01-01",
+                    "location": {"city": "London", "country": "UK"},
+                },
+                {
+                    "company_name": "Meta",
+                    "job_title": "Team Lead",
+                    "description": "Developed and maintained web applications.",
+                    "skills": ["Python", "SQL"],
+                    "starts_at": "2012-01-01",
+                    "ends_at": "2014-01-01",
+                    "location": {"city": "London", "country": "UK"},
+                },
+            ],
+        }
+    )
+)
+
+
+class TestEvaluationSchema(unittest.TestCase):
+    def test_experiences_are_sorted_by_ends_at(self):
+        self.assertEqual(
+            [experience.ends_ord for experience in TEST_PROFILE.experiences],
+            [
+                datetime.date(2014, 1, 1).toordinal(),
+                datetime.date(2020, 1, 1).toordinal(),
+                datetime.date(2021, 1, 1).toordinal(),
+            ],
+        )
+        self.assertEqual(TEST_PROFILE.company_names_lc, ('meta', 'google', 'apple'))
+        self.assertEqual(
+            TEST_PROFILE.job_titles_lc,
+            ('team lead', 'software engineer', 'senior engineer'),
+        )
+
+    def test_get_n_last_experiences(self):
+        self.assertEqual(
+            {
+                experience.company_name
+                for experience in TEST_PROFILE.get_n_last_experiences(2)
+            },
+            {'Google', 'Apple'},
+        )
+
+    def test_count_years_of_experience(self):
+        self.assertEqual(TEST_PROFILE.count_years_of_experience(), 7.0)
+
+    def test_count_years_of_overlapping_experience(self):
+        self.assertEqual(
+            TEST_PROFILE.count_years_of_experience(count_overlapping_experiences=True),
+            8.0,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+import contextlib
+import copy
+import io
+import json
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import config
+import main
+from match_service import specifications
+
+PROJECT_DIR = Path(main.__file__).parent
+TEST_PROFILES = json.loads((PROJECT_DIR / config.TEST_PROFILES_FILE).read_text())
+TARGET_SPECIFICATION = specifications.chain_specifications_for_position(
+    json.loads((PROJECT_DIR / config.TARGET_POSITIONS_CONFIG_FILE).read_text())[
+        'Middle UX-designer'
+    ]
+)
+# distinctly named copies of the only candidate matching target specification,
+# so every chunk has matches and matches reveal the order of profiles
+MATCHING_PROFILES = [
+    {**TEST_PROFILES[17], 'last_name': f'Garcia {index}'} for index in range(20)
+]
+
+
+class TestMain(unittest.TestCase):
+    def test_load_json(self):
+        self.assertEqual(
+            main.load_json(PROJECT_DIR / config.TEST_PROFILES_FILE), TEST_PROFILES
+        )
+
+    def test_load_json_without_orjson(self):
+        with mock.patch.object(main, 'orjson', None):
+            self.assertEqual(
+                main.load_json(PROJECT_DIR / config.TEST_PROFILES_FILE),
+                TEST_PROFILES,
+            )
+
+    @unittest.skipIf(main.ijson is None, 'ijson is not installed')
+    def test_iter_raw_profiles_streaming(self):
+        with mock.patch.object(
+            config, 'PROFILES_STREAMING_THRESHOLD_BYTES', 0
+        ), mock.patch.object(main, 'load_json', side_effect=AssertionError):
+            self.assertEqual(
+                list(main.iter_raw_profiles(PROJECT_DIR / config.TEST_PROFILES_FILE)),
+                TEST_PROFILES,
+            )
+
+    def test_iter_raw_profiles(self):
+        with mock.patch.object(main, 'ijson', None):
+            self.assertEqual(
+                list(main.iter_raw_profiles(PROJECT_DIR / config.TEST_PROFILES_FILE)),
+                TEST_PROFILES,
+            )
+
+    def test_evaluate_chunk(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            matched_candidates = main.evaluate_chunk(
+                TEST_PROFILES, TARGET_SPECIFICATION, strict=False
+            )
+        self.assertEqual(matched_candidates, [('Sophia', 'Garcia')])
+
+    def test_evaluate_chunk_skips_malformed_profiles(self):
+        malformed_profile = copy.deepcopy(TEST_PROFILES[0])
+        malformed_profile['skills'] = [1]
+        incomplete_profile = copy.deepcopy(TEST_PROFILES[0])
+        del incomplete_profile['experiences']
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            matched_candidates = main.evaluate_chunk(
+                [malformed_profile, incomplete_profile, *TEST_PROFILES],
+                TARGET_SPECIFICATION,
+                strict=False,
+            )
+        self.assertEqual(matched_candidates, [('Sophia', 'Garcia')])
+        self.assertEqual(
+            output.getvalue().count(
+                'Candidate provided invalid data - profile will not be considered.'
+            ),
+            2,
+        )
+
+    def test_iter_chunks(self):
+        self.assertEqual(list(main.iter_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(main.iter_chunks([], 2)), [])
+
+    def test_evaluate_profiles_serially(self):
+        with mock.patch.object(
+            main, 'ProcessPoolExecutor', side_effect=AssertionError
+        ), contextlib.redirect_stdout(io.StringIO()) as output:
+            for first_name, last_name in main.evaluate_profiles(
+                TEST_PROFILES, TARGET_SPECIFICATION, workers=2
+            ):
+                print(f"{first_name} {last_name} - True")
+
+        # matches are reported in order of profiles
+        output_lines = output.getvalue().splitlines()
+        match_index = output_lines.index('Sophia Garcia - True')
+        self.assertTrue(output_lines[match_index - 1].startswith('Mike Wong - False'))
+        self.assertTrue(
+            output_lines[match_index + 1].startswith('Kseniy Ivanovich Borodin - False')
+        )
+
+    def test_evaluate_profiles_in_parallel(self):
+        with mock.patch.object(config, 'EVALUATION_CHUNK_SIZE', 3), mock.patch.object(
+            config, 'PARALLEL_EVALUATION_MIN_PROFILES', 8
+        ):
+            serially_matched_candidates = list(
+                main.evaluate_profiles(
+                    MATCHING_PROFILES, TARGET_SPECIFICATION, workers=1
+                )
+            )
+            with mock.patch.object(
+                main,
+                'ProcessPoolExecutor',
+                wraps=main.ProcessPoolExecutor,
+            ) as process_pool_executor:
+                matched_candidates = list(
+                    main.evaluate_profiles(
+                        MATCHING_PROFILES, TARGET_SPECIFICATION, workers=2
+                    )
+                )
+
+        process_pool_executor.assert_called_once()
+        self.assertEqual(matched_candidates, serially_matched_candidates)
+        self.assertEqual(
+            matched_candidates,
+            [
+                (profile['first_name'], profile['last_name'])
+                for profile in MATCHING_PROFILES
+            ],
+        )
+
+    def test_evaluate_profiles_in_parallel_writes_output_in_chunk_order(self):
+        with contextlib.redirect_stdout(io.StringIO()) as serial_output:
+            main.evaluate_chunk(TEST_PROFILES, TARGET_SPECIFICATION, strict=False)
+
+        with mock.patch.object(config, 'EVALUATION_CHUNK_SIZE', 3), mock.patch.object(
+            config, 'PARALLEL_EVALUATION_MIN_PROFILES', 8
+        ), contextlib.redirect_stdout(io.StringIO()) as output:
+            matched_candidates = list(
+                main.evaluate_profiles(TEST_PROFILES, TARGET_SPECIFICATION, workers=2)
+            )
+
+        self.assertEqual(matched_candidates, [('Sophia', 'Garcia')])
+        self.assertEqual(output.getvalue(), serial_output.getvalue())
+
+    def test_evaluate_profiles_limits_chunks_in_flight(self):
+        consumed_profiles = []
+
+        def stream_profiles():
+            for profile in MATCHING_PROFILES:
+                consumed_profiles.append(profile)
+                yield profile
+
+        with mock.patch.object(config, 'EVALUATION_CHUNK_SIZE', 3), mock.patch.object(
+            config, 'PARALLEL_EVALUATION_MIN_PROFILES', 8
+        ):
+            matched_candidates = main.evaluate_profiles(
+                stream_profiles(), TARGET_SPECIFICATION, workers=2
+            )
+            self.assertEqual(next(matched_candidates), ('Sophia', 'Garcia 0'))
+            # no more than 2 chunks per worker are read before the first result
+            self.assertEqual(len(consumed_profiles), 2 * 2 * 3)
+            matched_candidates.close()
+
+    def test_init_worker(self):
+        self.addCleanup(main._init_worker, None, False)
+        main._init_worker(TARGET_SPECIFICATION, True)
+        self.assertIs(main._worker_target_specification, TARGET_SPECIFICATION)
+        self.assertTrue(main._worker_strict)
+
+        with contextlib.redirect_stdout(io.StringIO()) as worker_output:
+            output, matched_candidates = main._evaluate_chunk_in_worker(
+                [TEST_PROFILES[0], *MATCHING_PROFILES[:2]]
+            )
+        # output of the chunk is returned to the parent process instead of being written
+        self.assertEqual(worker_output.getvalue(), '')
+        self.assertTrue(output.startswith('Alice Lee - False'))
+        self.assertEqual(
+            matched_candidates, [('Sophia', 'Garcia 0'), ('Sophia', 'Garcia 1')]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
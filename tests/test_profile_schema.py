@@ -0,0 +1,72 @@
+import datetime
+import unittest
+
+from match_service import profile_schema
+
+TEST_PROFILE = {
+    "first_name": "Sophia",
+    "last_name": "Garcia",
+    "skills": ["Figma", "UX-research"],
+    "description": "I'm a Middle UX Designer.",
+    "location": {"city": "Barcelona", "country": "Spain"},
+    "experiences": [
+        {
+            "company_name": "Glovo",
+            "job_title": "UX Designer",
+            "description": "Collaborated with product managers and engineers.",
+            "skills": ["Sketch", "UX-research"],
+            "starts_at": "2022-06-01",
+            "ends_at": "2021-04-01",
+            "location": {"city": "Barcelona", "country": "Spain"},
+        },
+        {
+            "company_name": "Glovo",
+            "job_title": "Product Designer",
+            "description": "Collaborated with product managers and engineers.",
+            "skills": ["Sketch", "UX-research"],
+            "starts_at": "2020-09-01",
+            "ends_at": "2020-09-01",
+            "location": {"city": "Barcelona", "country": "Spain"},
+        },
+        {
+            "company_name": "Glovo",
+            "job_title": "Junior Designer",
+            "description": "Collaborated with product managers and engineers.",
+            "skills": ["Sketch", "UX-research"],
+            "starts_at": "2017-09-01",
+            "ends_at": "2019-04-01",
+            "location": {"city": "Barcelona", "country": "Spain"},
+        },
+        {
+            "company_name": "Glovo",
+            "job_title": "Lead Designer",
+            "description": "Collaborated with product managers and engineers.",
+            "skills": ["Sketch", "UX-research"],
+            "starts_at": "2022-06-01",
+            "ends_at": None,
+            "location": {"city": "Barcelona", "country": "Spain"},
+        },
+    ],
+}
+
+
+class TestProfileSchema(unittest.TestCase):
+    def test_construct_profile(self):
+        self.assertEqual(
+            profile_schema.construct_profile(TEST_PROFILE),
+            profile_schema.Profile(**TEST_PROFILE),
+        )
+
+    def test_sanitize_experiences(self):
+        profile = profile_schema.sanitize_experiences(
+            profile_schema.construct_profile(TEST_PROFILE)
+        )
+        self.assertEqual(
+            [experience.job_title for experience in profile.experiences],
+            ["Junior Designer", "Lead Designer"],
+        )
+        self.assertEqual(profile.experiences[1].ends_at, datetime.date.today())
+
+
+if __name__ == '__main__':
+    unittest.main()
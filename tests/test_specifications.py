@@ -1,9 +1,15 @@
 import unittest
 
-from match_service import profile_schema, specifications, utils
+from match_service import (
+    constants,
+    evaluation_schema,
+    profile_schema,
+    specifications,
+    utils,
+)
 
 
-POTENTIAL_CANDIDATE = profile_schema.Profile(
+POTENTIAL_CANDIDATE_PROFILE = profile_schema.Profile(
     **{
         "first_name": "Sophia",
         "last_name": "Garcia",
@@ -32,6 +38,9 @@ POTENTIAL_CANDIDATE = profile_schema.Profile(
         ],
     }
 )
+POTENTIAL_CANDIDATE = evaluation_schema.EvalProfile.from_profile(
+    POTENTIAL_CANDIDATE_PROFILE
+)
 
 
 class TestSpecifications(unittest.TestCase):
@@ -52,6 +61,18 @@ class TestSpecifications(unittest.TestCase):
             target_specification.is_satisfied_by(POTENTIAL_CANDIDATE), False
         )
 
+    def test_location_eu(self):
+        target_specification = specifications.specification_factory(
+            'location', {'countries': ['UK', 'eu'], 'cities': []}
+        )
+        self.assertEqual(
+            target_specification.expected_locations,
+            {'UK', *constants.EU_COUNTRIES},
+        )
+        self.assertEqual(
+            target_specification.is_satisfied_by(POTENTIAL_CANDIDATE), True
+        )
+
     def test_skills(self):
         target_specification = specifications.SkillsSpecification(
             expected_skills=utils.LowerCaseFrozenSet({'Unreal Engine 7', 'Cooking'}),
@@ -100,6 +121,68 @@ class TestSpecifications(unittest.TestCase):
             target_specification.is_satisfied_by(POTENTIAL_CANDIDATE), True
         )
 
+    def test_chain_specifications_for_position(self):
+        target_specification = specifications.chain_specifications_for_position(
+            {
+                "skills_at_work": {"check_last_n_experiences": 1, "name": ["Miro"]},
+                "experience_total": {"comparison_operand": "<", "years": 5},
+                "position": {"check_last_n_experiences": 2, "name": ["UX Designer"]},
+                "skills": {"name": ["Figma", "Sketch"], "number_of_hits": 1},
+                "location": {"countries": ["Spain"], "cities": []},
+            }
+        )
+        self.assertEqual(
+            [type(spec) for spec in target_specification.specifications],
+            [
+                specifications.LocationSpecification,
+                specifications.SkillsSpecification,
+                specifications.PositionSpecification,
+                specifications.TotalWorkExperienceSpecification,
+                specifications.SkillsAtWorkSpecification,
+            ],
+        )
+        self.assertEqual(
+            target_specification.is_satisfied_by(POTENTIAL_CANDIDATE), True
+        )
+
+    def test_specification_factory(self):
+        self.assertEqual(
+            specifications.specification_factory(
+                'position', {'check_last_n_experiences': 2, 'name': ['UX Designer']}
+            ),
+            specifications.PositionSpecification(
+                positions_expected=utils.LowerCaseFrozenSet({'UX Designer'}),
+                number_of_last_experiences_to_be_checked=2,
+            ),
+        )
+        self.assertIsNone(specifications.specification_factory('salary', {}))
+        with self.assertRaises(ValueError):
+            specifications.specification_factory(
+                'employer', {'check_last_n_experiences': 0, 'name': 'FAANG'}
+            )
+
+    def test_and(self):
+        location_specification = specifications.LocationSpecification(
+            expected_locations=['Spain']
+        )
+        skills_specification = specifications.SkillsSpecification(
+            expected_skills=utils.LowerCaseFrozenSet({'Figma'}),
+        )
+        position_specification = specifications.PositionSpecification(
+            positions_expected=utils.LowerCaseFrozenSet({'Product Designer'}),
+            number_of_last_experiences_to_be_checked=10,
+        )
+        target_specification = location_specification.and_(skills_specification).and_(
+            position_specification
+        )
+        self.assertEqual(
+            target_specification.specifications,
+            (location_specification, skills_specification, position_specification),
+        )
+        self.assertEqual(
+            target_specification.is_satisfied_by(POTENTIAL_CANDIDATE), True
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -58,6 +58,27 @@ class TestUtils(unittest.TestCase):
             [[datetime.date(1999, 7, 20), datetime.date(2022, 10, 18)]],
         )
 
+    def test_merge_ordinal_intervals(self):
+        self.assertEqual(
+            utils.merge_intervals(
+                [[735434, 736985], [736620, 737426], [737790, 738630]]
+            ),
+            [[735434, 737426], [737790, 738630]],
+        )
+
+    def test_merge_no_intervals(self):
+        self.assertEqual(utils.merge_intervals([]), [])
+
+    def test_lower_case_frozen_set(self):
+        lower_case_set = utils.LowerCaseFrozenSet(['Figma', 'UX-research', 'figma'])
+        self.assertIsInstance(lower_case_set, utils.LowerCaseFrozenSet)
+        self.assertEqual(lower_case_set, {'figma', 'ux-research'})
+
+    def test_lower_case_frozen_set_from_already_lower(self):
+        lower_case_set = utils.LowerCaseFrozenSet.from_already_lower(['figma', 'miro'])
+        self.assertIsInstance(lower_case_set, utils.LowerCaseFrozenSet)
+        self.assertEqual(lower_case_set, {'figma', 'miro'})
+
 
 if __name__ == '__main__':
     unittest.main()